@@ -1,7 +1,41 @@
+import hashlib
+import io
 import streamlit as st
 import pandas as pd
-from utils.parse import load_feed
-from validators import run_all_validations
+from collections import Counter
+from utils.parse import parse_feed
+from validators import run_feed_validations
+
+# distinct uploads whose parsed feed and results stay in server memory
+FEED_CACHE_ENTRIES = 4
+REPORT_PAGE_SIZE = 50
+
+# Streamlit reruns the script on every widget interaction; keep the parsed
+# feed and its results per upload, keyed on a digest of the bytes taken
+# once per rerun. cache_resource returns the same read-only objects on a
+# hit, where cache_data would unpickle a fresh copy every rerun.
+@st.cache_resource(max_entries=FEED_CACHE_ENTRIES, show_spinner=False)
+def load_products(digest, name, _raw):
+    return parse_feed(_raw, name)
+
+@st.cache_resource(max_entries=FEED_CACHE_ENTRIES, show_spinner=False)
+def validate_products(digest, name, _products):
+    return run_feed_validations(_products)
+
+SUMMARY_FIELDS = ("id", "title", "price", "availability", "inventory_quantity")
+
+@st.cache_resource(max_entries=FEED_CACHE_ENTRIES, show_spinner=False)
+def summary_csv(digest, name, _products, _results):
+    cols = {f: [] for f in SUMMARY_FIELDS + ("errors", "warnings")}
+    # one pass over products and their results fills every column
+    for p, r in zip(_products, _results):
+        for f in SUMMARY_FIELDS:
+            cols[f].append(p.get(f, ""))
+        cols["errors"].append(" | ".join(r['errors']))
+        cols["warnings"].append(" | ".join(r['warnings']))
+    buf = io.BytesIO()
+    pd.DataFrame({"index": range(1, len(_products)+1), **cols}).to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
 
 st.set_page_config(page_title="Product Feed Validator (Full Spec Modular)", layout="wide")
 st.title("🔎 Product Feed Validator — Full Spec (Modular)")
@@ -11,17 +45,16 @@ if not uploaded:
     st.info("Upload a .json or .xml file to begin validation.")
     st.stop()
 
+raw = uploaded.getvalue()
+digest = hashlib.sha256(raw).hexdigest()
 try:
-    products = load_feed(uploaded)
+    products = load_products(digest, uploaded.name, raw)
 except Exception as e:
     st.error(f"Failed to parse file: {e}")
     st.stop()
 
 st.success(f"Detected {len(products)} product records.")
-results = []
-for p in products:
-    res = run_all_validations(p)
-    results.append(res)
+results = validate_products(digest, uploaded.name, products)
 
 # Summary
 total_errors = sum(len(r['errors']) for r in results)
@@ -32,41 +65,39 @@ c2.metric("Total errors", total_errors)
 c3.metric("Total warnings", total_warnings)
 
 # Top issues
-issue_counts = {}
+issue_counts = Counter()
 for r in results:
-    for e in r['errors']:
-        issue_counts[e] = issue_counts.get(e,0) + 1
-    for w in r['warnings']:
-        issue_counts[w] = issue_counts.get(w,0) + 1
+    issue_counts.update(r['errors'])
+    issue_counts.update(r['warnings'])
 
 if issue_counts:
     st.subheader("Top issues")
-    df_issues = pd.DataFrame(sorted(issue_counts.items(), key=lambda x: -x[1]), columns=["Issue","Count"])
+    df_issues = pd.DataFrame(issue_counts.most_common(), columns=["Issue","Count"])
     st.dataframe(df_issues)
 
 # Detailed per-product
 st.subheader("Detailed product reports")
-for idx, (p, r) in enumerate(zip(products, results), start=1):
+# only one page of expanders is sent to the browser per rerun
+n_pages = max(1, (len(products) + REPORT_PAGE_SIZE - 1) // REPORT_PAGE_SIZE)
+page = int(st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1)) if n_pages > 1 else 1
+start = (page - 1) * REPORT_PAGE_SIZE
+end = min(start + REPORT_PAGE_SIZE, len(products))
+if products:
+    st.caption(f"Showing products {start+1}–{end} of {len(products)}")
+# one DataFrame for the whole page; each expander shows its slice of rows
+page_fields = pd.DataFrame([f for r in results[start:end] for f in r['fields']], columns=["Field","Value"])
+offset = 0
+for idx, (p, r) in enumerate(zip(products[start:end], results[start:end]), start=start+1):
+    n_fields = len(r['fields'])
     with st.expander(f"Product {idx} — ID: {p.get('id','(no id)')}"):
-        df = pd.DataFrame(r['fields'])
-        st.dataframe(df)
+        st.dataframe(page_fields.iloc[offset:offset+n_fields].reset_index(drop=True))
         if r['errors']:
             st.error("Errors:\n- " + "\n- ".join(r['errors']))
         if r['warnings']:
             st.warning("Warnings:\n- " + "\n- ".join(r['warnings']))
         if r['infos']:
             st.info("Info:\n- " + "\n- ".join(r['infos']))
+    offset += n_fields
 
 # Download CSV summary
-rows = []
-for idx, (p, r) in enumerate(zip(products, results), start=1):
-    rows.append({
-        "index": idx,
-        "id": p.get("id",""),
-        "title": p.get("title",""),
-        "price": p.get("price",""),
-        "errors": " | ".join(r['errors']),
-        "warnings": " | ".join(r['warnings'])
-    })
-df_report = pd.DataFrame(rows)
-st.download_button("Download summary CSV", df_report.to_csv(index=False).encode('utf-8'), "validation_summary.csv", "text/csv")
+st.download_button("Download summary CSV", summary_csv(digest, uploaded.name, products, results), "validation_summary.csv", "text/csv")
@@ -1,57 +1,107 @@
+import io
 import json
+import sys
+from collections import deque
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Any
 
+def _iter_nodes(obj):
+    # breadth-first, so the shallowest product list wins; parsed JSON is a
+    # tree, so no visited set is needed
+    queue=deque([obj])
+    while queue:
+        cur=queue.popleft()
+        yield cur
+        if isinstance(cur, list):
+            queue.extend(cur)
+        elif isinstance(cur, dict):
+            queue.extend(cur.values())
+
+def _is_record_list(cur):
+    return isinstance(cur, list) and bool(cur) and all(isinstance(i, dict) for i in cur)
+
 def extract_products_from_json(obj):
-    if isinstance(obj, list) and all(isinstance(i, dict) for i in obj):
-        return obj
-    if isinstance(obj, dict):
+    # common shapes first: a bare list of products or a well-known key
+    if isinstance(obj, list):
+        if _is_record_list(obj):
+            return obj
+    elif isinstance(obj, dict):
         for key in ('products','items','feed','entries','data'):
             if key in obj and isinstance(obj[key], list):
                 return obj[key]
-    # BFS search for first list-of-dicts
-    queue=[obj]
-    seen=set()
-    while queue:
-        cur=queue.pop(0)
-        if id(cur) in seen:
-            continue
-        seen.add(id(cur))
-        if isinstance(cur, list):
-            if cur and all(isinstance(i, dict) for i in cur):
-                return cur
-            for it in cur:
-                queue.append(it)
-        elif isinstance(cur, dict):
-            for v in cur.values():
-                queue.append(v)
+    else:
+        return []
+    # otherwise the first list-of-dicts anywhere below the root
+    for cur in _iter_nodes(obj):
+        if _is_record_list(cur):
+            return cur
     if isinstance(obj, dict):
         return [obj]
     return []
 
-def load_feed(uploaded) -> List[Dict[str,Any]]:
-    raw = uploaded.getvalue().decode('utf-8')
-    name = uploaded.name.lower()
+def _el_to_dict(el):
+    obj={}
+    for c in el:
+        tag = c.tag.rpartition('}')[2]
+        # if nested, convert children to dict (peek instead of list(c))
+        if next(iter(c), None) is not None:
+            obj[tag]={cc.tag.rpartition('}')[2]: cc.text or '' for cc in c}
+        else:
+            obj[tag]=c.text or ''
+    return obj
+
+def _iter_xml_products(fileobj):
+    # stream the parse so each top-level product can be freed once converted
+    found={'item':[], 'product':[], 'entry':[]}
+    root=None
+    # candidates currently open; one nested inside another (an item's
+    # <product> field) must survive until the outer one is converted. Each
+    # takes its slot on start so nested ones keep document order.
+    open_=[]
+    for event, el in ET.iterparse(fileobj, events=('start','end')):
+        if root is None:
+            root=el
+        if el is root:
+            # like findall('.//item'), only elements below the root count
+            continue
+        bucket=found.get(el.tag.rpartition('}')[2])
+        if bucket is None:
+            continue
+        if event == 'start':
+            open_.append((bucket, len(bucket)))
+            bucket.append(None)
+        else:
+            bucket, i = open_.pop()
+            bucket[i] = _el_to_dict(el)
+            if not open_:
+                el.clear()
+    out = found['item'] or found['product'] or found['entry']
+    if out or root is None:
+        return out
+    return [_el_to_dict(el) for el in root]
+
+# enum-like fields repeat the same few values across the whole feed
+_ENUM_FIELDS = ('availability','condition','age_group','relationship_type','enable_search','enable_checkout')
+
+def _intern_enums(products):
+    # one shared str per distinct value instead of a fresh copy per product
+    for p in products:
+        if isinstance(p, dict):
+            for k in _ENUM_FIELDS:
+                v = p.get(k)
+                if type(v) is str:
+                    p[k] = sys.intern(v)
+    return products
+
+def parse_feed(raw: bytes, name: str) -> List[Dict[str,Any]]:
+    name = name.lower()
     if name.endswith('.json'):
-        parsed = json.loads(raw)
-        return extract_products_from_json(parsed)
+        parsed = json.loads(raw.decode('utf-8'))
+        return _intern_enums(extract_products_from_json(parsed))
     elif name.endswith('.xml'):
-        root = ET.fromstring(raw)
-        candidates = root.findall('.//item') or root.findall('.//product') or root.findall('.//entry') or list(root)
-        out=[]
-        for el in candidates:
-            obj={}
-            for c in el:
-                tag = c.tag.split('}')[-1]
-                # if nested, convert children to dict
-                if list(c):
-                    inner={}
-                    for cc in c:
-                        inner[cc.tag.split('}')[-1]] = cc.text or ''
-                    obj[tag]=inner
-                else:
-                    obj[tag]=c.text or ''
-            out.append(obj)
-        return out
+        return _intern_enums(_iter_xml_products(io.BytesIO(raw)))
     else:
         raise ValueError('Unsupported file type')
+
+def load_feed(uploaded) -> List[Dict[str,Any]]:
+    return parse_feed(uploaded.getvalue(), uploaded.name)
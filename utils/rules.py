@@ -1,29 +1,60 @@
+import re
 from urllib.parse import urlparse
 from datetime import datetime, timezone
 
+# urlparse's own cleanup: leading C0 controls/space are stripped and tabs
+# and newlines are dropped anywhere before the scheme is read
+_URL_LSTRIP = ''.join(map(chr, range(33)))
+_URL_RE = re.compile(r"^https?://([^/?#]*)", re.IGNORECASE | re.ASCII)
+
 def is_url(s):
+    # one regex match instead of building a urlparse ParseResult; only hosts
+    # urlparse would validate further (brackets, non-ASCII) go through it
     if not s:
         return False
+    s = str(s).lstrip(_URL_LSTRIP)
+    if '\t' in s or '\r' in s or '\n' in s:
+        s = s.replace('\t', '').replace('\r', '').replace('\n', '')
+    m = _URL_RE.match(s)
+    if m is None or not m.group(1):
+        return False
+    host = m.group(1)
+    if host.isascii() and '[' not in host and ']' not in host:
+        return True
     try:
-        p=urlparse(str(s))
-        return p.scheme in ('http','https') and bool(p.netloc)
-    except:
+        return bool(urlparse(s).netloc)
+    except ValueError:
         return False
 
+def is_one_of(v, allowed):
+    # frozenset lookup; feed values that are lists/dicts are unhashable but
+    # could never match an allowed string anyway
+    return isinstance(v, str) and v in allowed
+
+# every form fromisoformat or '%Y-%m-%d' accepts starts like this (YYYY-MM,
+# YYYYMMDD, YYYY-Www, YYYY-DDD, 2024-1-5); anything else is rejected here
+# instead of raising and catching two ValueErrors
+_ISO_PREFIX_RE = re.compile(r"^\d{4}-?[W\d]")
+
 def is_iso8601_date(s):
     if not s:
         return False
+    s = str(s)
+    if not _ISO_PREFIX_RE.match(s):
+        return False
     try:
-        datetime.fromisoformat(str(s))
+        datetime.fromisoformat(s)
         return True
     except:
         try:
-            datetime.strptime(str(s), '%Y-%m-%d')
+            datetime.strptime(s, '%Y-%m-%d')
             return True
         except:
             return False
 
 def parse_iso_date(s):
+    if isinstance(s, str) and not _ISO_PREFIX_RE.match(s):
+        return None
     try:
         return datetime.fromisoformat(s)
     except:
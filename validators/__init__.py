@@ -14,13 +14,66 @@ from .reviews import validate_reviews
 from .related import validate_related
 from .geo import validate_geo
 
-def run_all_validations(p):
-    errors=[]; warnings=[]; infos=[]; fields=[]
-    for fn in [validate_flags, validate_basic, validate_item_info, validate_media,
+_VALIDATORS = (validate_flags, validate_basic, validate_item_info, validate_media,
                validate_pricing, validate_availability, validate_variants,
                validate_fulfillment, validate_merchant, validate_returns,
                validate_performance, validate_compliance, validate_reviews,
-               validate_related, validate_geo]:
+               validate_related, validate_geo)
+
+def run_all_validations(p):
+    errors=[]; warnings=[]; infos=[]; fields=[]
+    for fn in _VALIDATORS:
         e,w,f = fn(p)
         errors+=e; warnings+=w; fields+=f
     return {'errors':errors,'warnings':warnings,'infos':infos,'fields':fields}
+
+class _KeyRecorder(dict):
+    # an empty product that notes every key a validator looks up; anything
+    # that walks the whole product marks the record as incomplete
+    def __init__(self):
+        super().__init__()
+        self.read=set(); self.complete=True
+    def get(self, key, default=None):
+        self.read.add(key)
+        return default
+    def __getitem__(self, key):
+        self.read.add(key)
+        raise KeyError(key)
+    def __contains__(self, key):
+        self.read.add(key)
+        return False
+    def _walk(self, *a):
+        self.complete=False
+        return iter(())
+    __iter__ = keys = values = items = _walk
+    def __len__(self):
+        self.complete=False
+        return 0
+
+def _empty_result(fn):
+    # fn's result for a product without any of the keys it reads. A product
+    # that has none of those keys takes the same path through fn, so it gets
+    # the same result; None when fn looked at the product as a whole.
+    rec=_KeyRecorder()
+    result=fn(rec)
+    return (frozenset(rec.read), result) if rec.complete else None
+
+_EMPTY_RESULTS={fn: r for fn in _VALIDATORS if (r := _empty_result(fn)) is not None}
+
+def run_feed_validations(products):
+    # same output as run_all_validations per product; a validator none of
+    # whose keys occur anywhere in the feed runs once and its result is
+    # shared by every product (the row dicts too; results are read-only)
+    present=set().union(*products)
+    plan=[]
+    for fn in _VALIDATORS:
+        read, result = _EMPTY_RESULTS.get(fn, (None, None))
+        plan.append((None, result) if read is not None and present.isdisjoint(read) else (fn, None))
+    out=[]
+    for p in products:
+        errors=[]; warnings=[]; infos=[]; fields=[]
+        for fn, result in plan:
+            e,w,f = fn(p) if fn is not None else result
+            errors+=e; warnings+=w; fields+=f
+        out.append({'errors':errors,'warnings':warnings,'infos':infos,'fields':fields})
+    return out
@@ -1,11 +1,14 @@
-from utils.rules import is_iso8601_date
+from utils.rules import is_iso8601_date, is_one_of
+
+_AVAILABILITY = frozenset({'in_stock','out_of_stock','preorder'})
+
 def validate_availability(p):
     errors=[]; warnings=[]; rows=[]
     availability = p.get('availability')
     if not availability:
         errors.append('Missing required field: availability')
     else:
-        if availability not in ('in_stock','out_of_stock','preorder'):
+        if not is_one_of(availability, _AVAILABILITY):
             errors.append("availability must be one of in_stock, out_of_stock, preorder")
     rows.append({'Field':'availability','Value':availability})
     if availability == 'preorder':
@@ -1,6 +1,8 @@
 from utils.rules import is_url, is_iso8601_date
 import re
 
+_GTIN_RE = re.compile(r'^[0-9]{8,14}$')
+
 def validate_basic(p):
     errors=[]; warnings=[]; rows=[]
     # id
@@ -16,7 +18,7 @@ def validate_basic(p):
     if not gtin:
         warnings.append('gtin recommended')
     else:
-        if not re.match(r'^[0-9]{8,14}$', str(gtin)):
+        if not _GTIN_RE.match(str(gtin)):
             warnings.append('gtin should be 8-14 digits')
     rows.append({'Field':'gtin','Value':gtin})
     # mpn
@@ -1,10 +1,14 @@
-from utils.rules import is_url
+from utils.rules import is_url, is_one_of
 import re
+
+_CONDITIONS = frozenset({'new','refurbished','used'})
+_AGE_GROUPS = frozenset({'newborn','infant','toddler','kids','adult'})
+
 def validate_item_info(p):
     errors=[]; warnings=[]; rows=[]
     # condition
     condition = p.get('condition')
-    if condition and condition not in ('new','refurbished','used'):
+    if condition and not is_one_of(condition, _CONDITIONS):
         warnings.append('condition should be new/refurbished/used')
     rows.append({'Field':'condition','Value':condition})
     # product_category
@@ -31,7 +35,7 @@ def validate_item_info(p):
     rows.append({'Field':'weight','Value':weight})
     # age_group
     age = p.get('age_group')
-    if age and age not in ('newborn','infant','toddler','kids','adult'):
+    if age and not is_one_of(age, _AGE_GROUPS):
         warnings.append('age_group should be one of newborn, infant, toddler, kids, adult')
     rows.append({'Field':'age_group','Value':age})
     return errors,warnings,rows
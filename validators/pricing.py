@@ -1,20 +1,37 @@
 import re
+import json
 from utils.rules import is_iso8601_date
+
+_PRICE_RE = re.compile(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Z]{3})?\s*$")
+_SALE_RANGE_RE = re.compile(r"\s*/\s*")
+
 def parse_price(value):
     if value is None:
         return None,None
+    # JSON feeds often carry prices already parsed; skip str() + regex
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return float(value), None
+        except OverflowError:
+            # int beyond float range; the string path below reads it as +/-inf
+            pass
+    if isinstance(value, dict):
+        try:
+            return float(value['value']), value.get('currency')
+        except:
+            return None,None
     s=str(value).strip()
-    m = re.match(r"^\s*([0-9]+(?:\.[0-9]+)?)\s*([A-Z]{3})?\s*$", s)
+    m = _PRICE_RE.match(s)
     if m:
         return float(m.group(1)), m.group(2)
-    # try json-like
-    try:
-        import json
-        parsed = json.loads(s)
-        if isinstance(parsed, dict) and 'value' in parsed:
-            return float(parsed['value']), parsed.get('currency')
-    except:
-        pass
+    # try json-like; only an object can carry value/currency
+    if s.startswith('{'):
+        try:
+            parsed = json.loads(s)
+            if isinstance(parsed, dict) and 'value' in parsed:
+                return float(parsed['value']), parsed.get('currency')
+        except:
+            pass
     parts = s.split()
     if not parts:
         return None,None
@@ -46,7 +63,7 @@ def validate_pricing(p):
     rows.append({'Field':'sale_price','Value':sale})
     sale_eff = p.get('sale_price_effective_date')
     if sale and sale_eff:
-        parts = re.split(r"\s*/\s*", str(sale_eff))
+        parts = _SALE_RANGE_RE.split(str(sale_eff))
         if len(parts)!=2:
             errors.append('sale_price_effective_date must be range start/end')
         else:
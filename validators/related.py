@@ -1,3 +1,7 @@
+from utils.rules import is_one_of
+
+_RELATIONSHIP_TYPES = frozenset({'part_of_set','required_part','often_bought_with','substitute','different_brand','accessory'})
+
 def validate_related(p):
     errors=[]; warnings=[]; rows=[]
     rel = p.get('related_product_id')
@@ -6,7 +10,7 @@ def validate_related(p):
         pass
     rows.append({'Field':'related_product_id','Value':rel})
     rt = p.get('relationship_type')
-    if rt and rt not in ('part_of_set','required_part','often_bought_with','substitute','different_brand','accessory'):
+    if rt and not is_one_of(rt, _RELATIONSHIP_TYPES):
         warnings.append('relationship_type value unexpected')
     rows.append({'Field':'relationship_type','Value':rt})
     return errors,warnings,rows
@@ -1,23 +1,41 @@
-def validate_reviews(p):
-    errors=[]; warnings=[]; rows=[]
-    prc = p.get('product_review_count')
+from functools import lru_cache
+
+# keyed on the two numeric fields only; the rows, which also carry the
+# free-text q_and_a/raw_review_data, are built fresh on every call.
+# typed, so 1, 1.0 and True are checked separately.
+@lru_cache(maxsize=1024, typed=True)
+def _review_warnings(prc, prr):
+    warnings=[]
     if prc is not None:
-        try:
-            if int(prc) < 0:
+        # JSON ints (bools too) need no int() round trip
+        if isinstance(prc, int):
+            if prc < 0:
                 warnings.append('product_review_count must be non-negative')
-        except:
-            warnings.append('product_review_count should be integer')
-    rows.append({'Field':'product_review_count','Value':prc})
-    prr = p.get('product_review_rating')
+        else:
+            try:
+                if int(prc) < 0:
+                    warnings.append('product_review_count must be non-negative')
+            except (TypeError, ValueError, OverflowError):
+                warnings.append('product_review_count should be integer')
     if prr is not None:
         try:
-            v=float(prr)
+            v = prr if isinstance(prr, float) else float(prr)
             if v < 0 or v > 5:
                 warnings.append('product_review_rating should be between 0 and 5')
-        except:
+        except (TypeError, ValueError, OverflowError):
             warnings.append('product_review_rating should be numeric')
-    rows.append({'Field':'product_review_rating','Value':prr})
+    return tuple(warnings)
+
+def validate_reviews(p):
+    errors=[]
+    prc = p.get('product_review_count')
+    prr = p.get('product_review_rating')
+    try:
+        warnings = list(_review_warnings(prc, prr))
+    except TypeError:
+        # unhashable value (list/dict), validate uncached
+        warnings = list(_review_warnings.__wrapped__(prc, prr))
     # q_and_a and raw_review_data lightly added
-    rows.append({'Field':'q_and_a','Value':p.get('q_and_a')})
-    rows.append({'Field':'raw_review_data','Value':p.get('raw_review_data')})
+    rows = [{'Field':'product_review_count','Value':prc}, {'Field':'product_review_rating','Value':prr},
+            {'Field':'q_and_a','Value':p.get('q_and_a')}, {'Field':'raw_review_data','Value':p.get('raw_review_data')}]
     return errors,warnings,rows
@@ -1,16 +1,30 @@
-def validate_variants(p):
-    errors=[]; warnings=[]; rows=[]
-    item_group = p.get('item_group_id')
+from functools import lru_cache
+
+# keyed only on what decides the messages: item_group_id and offer_id by
+# truthiness, color/size by value. Returns tuples so no caller can mutate
+# a cached result.
+@lru_cache(maxsize=1024, typed=True)
+def _variant_issues(has_group, color, size, has_offer):
+    errors=[]; warnings=[]
     # detect variant fields
-    variant_fields = any(p.get(f) for f in ('color','size','offer_id'))
-    if variant_fields and not item_group:
+    if (color or size or has_offer) and not has_group:
         errors.append('item_group_id required when variants exist')
-    rows.append({'Field':'item_group_id','Value':item_group})
     # sizes/colors recommendations
-    if p.get('color') and len(str(p.get('color'))) > 40:
+    if color and len(str(color)) > 40:
         warnings.append('color exceeds 40 chars')
-    rows.append({'Field':'color','Value':p.get('color')})
-    if p.get('size') and len(str(p.get('size'))) > 20:
+    if size and len(str(size)) > 20:
         warnings.append('size exceeds 20 chars')
-    rows.append({'Field':'size','Value':p.get('size')})
-    return errors,warnings,rows
+    return tuple(errors), tuple(warnings)
+
+def validate_variants(p):
+    item_group = p.get('item_group_id')
+    color = p.get('color')
+    size = p.get('size')
+    key = (bool(item_group), color, size, bool(p.get('offer_id')))
+    try:
+        errors, warnings = _variant_issues(*key)
+    except TypeError:
+        # unhashable value (list/dict), validate uncached
+        errors, warnings = _variant_issues.__wrapped__(*key)
+    rows = [{'Field':'item_group_id','Value':item_group}, {'Field':'color','Value':color}, {'Field':'size','Value':size}]
+    return list(errors),list(warnings),rows